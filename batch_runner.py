@@ -322,7 +322,7 @@ def generate_manifest(experiments: List[dict], output_dir: Path):
     return manifest
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Batch parameter sweep for morphic field experiments')
     parser.add_argument('--experiment-type', choices=['full', 'control', 'morphic', 'focused'], default='focused',
                         help='Type of experiment sweep to run')
@@ -334,8 +334,10 @@ def main():
                         help='Limit number of experiments (for testing)')
     parser.add_argument('--verbose', action='store_true',
                         help='Show all output including generation progress (default: condensed)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Stop after the first failed experiment and exit non-zero')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     console = Console()
 
@@ -401,6 +403,9 @@ def main():
             successful += 1
         else:
             failed += 1
+            if args.fail_fast:
+                console.print("[bold red]⏹ Stopping batch after first failure (--fail-fast)[/bold red]")
+                break
 
         # Show updated stats after each experiment
         elapsed = time.time() - start_time
@@ -427,6 +432,9 @@ def main():
     console.print(f"[cyan]📋 Manifest:[/cyan] {output_dir / 'manifest.json'}")
     console.print("[bold magenta]{'='*60}[/bold magenta]\n")
 
+    if args.fail_fast and failed:
+        sys.exit(1)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,30 @@
+"""
+Shared pytest fixtures
+
+Collecting every test_*.py in one pytest session lets the heavy imports and
+HTTP client be set up once instead of once per script.
+"""
+
+import httpx
+import pytest
+
+
+@pytest.fixture(scope="session")
+def http_client():
+    """A pooled httpx.Client shared by every test in the run"""
+    with httpx.Client(timeout=10) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def live_server():
+    """Start main.py once for the whole session and yield its base URL"""
+    from test_server_functionality import start_server, stop_server, wait_for_server
+
+    process = start_server()
+    try:
+        if not wait_for_server(process=process):
+            pytest.skip("Server failed to start")
+        yield "http://localhost:8000"
+    finally:
+        stop_server(process)
@@ -16,11 +16,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from sqlalchemy.exc import IntegrityError
+
 from storage.database import get_session, get_async_session
 from storage.models import IntegratedRun, SimulationRun, generate_run_id, generate_unique_slug
 
 logger = logging.getLogger(__name__)
 
+# How many slugs to try before giving up on creating an integrated run
+SLUG_ATTEMPTS = 3
+
 
 class IntegratedRunEngine:
     """Manages integrated simulation runs"""
@@ -34,20 +39,29 @@ class IntegratedRunEngine:
 
         # Generate unique identifiers
         run_id = generate_run_id()
-        slug = generate_unique_slug(custom_slug)
 
         # Create database entry
         session = get_session()
         try:
-            integrated_run = IntegratedRun(
-                run_id=run_id,
-                slug=slug,
-                parameters=parameters,
-                status='pending',
-                current_stage='Initializing'
-            )
-            session.add(integrated_run)
-            session.commit()
+            # Slugs are only unique per process; retry if another process took it
+            for attempt in range(SLUG_ATTEMPTS):
+                slug = generate_unique_slug(custom_slug)
+                integrated_run = IntegratedRun(
+                    run_id=run_id,
+                    slug=slug,
+                    parameters=parameters,
+                    status='pending',
+                    current_stage='Initializing'
+                )
+                session.add(integrated_run)
+                try:
+                    session.commit()
+                    break
+                except IntegrityError:
+                    session.rollback()
+                    if attempt == SLUG_ATTEMPTS - 1:
+                        raise
+                    logger.warning(f"Slug {slug} already taken, retrying")
             session.refresh(integrated_run)
 
             # Create run directory immediately to prevent frontend polling issues
@@ -283,6 +297,7 @@ class IntegratedRunEngine:
                         results_data = json.load(f)
                         sim_run.generations = results_data.get('generations', params.get("generations", 50))
                         sim_run.final_population = results_data.get('final_population', 0)
+                        sim_run.apply_results_summary(results_data)
                 except Exception as e:
                     logger.warning(f"Could not parse results file {results_path}: {e}")
                     sim_run.generations = params.get("generations", 50)
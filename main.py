@@ -25,6 +25,7 @@ from io import BytesIO
 from pydantic import BaseModel
 from typing import Optional, List
 import asyncio
+import httpx
 
 # Import our integrated runs functionality
 from integrated_runs import integrated_run_engine
@@ -58,7 +59,7 @@ app.mount("/results", StaticFiles(directory="results"), name="results")
 def generate_cache_key(data):
     """Generate cache key from data"""
     content = json.dumps(data, sort_keys=True)
-    return hashlib.md5(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
 def load_simulation_data(path):
     """Load simulation data from file"""
@@ -749,6 +750,33 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "emergence-simulator"}
 
+# Key pages and assets exercised by /selftest
+SELFTEST_ENDPOINTS = [
+    "/static/css/main.css",
+    "/integrated-runs/gallery",
+    "/api/integrated-runs",
+    "/"
+]
+
+async def selftest():
+    """Request each key endpoint in-process and report its status code"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://selftest") as client:
+        responses = await asyncio.gather(
+            *[client.get(endpoint) for endpoint in SELFTEST_ENDPOINTS],
+            return_exceptions=True
+        )
+
+    return {
+        endpoint: 500 if isinstance(response, Exception) else response.status_code
+        for endpoint, response in zip(SELFTEST_ENDPOINTS, responses)
+    }
+
+# Each call fans out to the main page and the DB-backed runs list, so the
+# route only exists when the test harness asks for it
+if os.getenv("ENABLE_SELFTEST") == "1":
+    app.add_api_route("/selftest", selftest, methods=["GET"], include_in_schema=False)
+
 @app.get("/viewer", response_class=HTMLResponse)
 async def viewer():
     """Enhanced viewer with historical simulation support"""
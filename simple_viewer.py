@@ -5,21 +5,47 @@ Simple Historical Viewer Test - Simplified version for testing
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 import json
 import os
+import asyncio
+import queue
+from itertools import islice
+import threading
 from datetime import datetime
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
 import seaborn as sns
+import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
 from typing import List, Optional
 import hashlib
 import base64
+import logging
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available, fall back to the standard json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson not available, summaries fall back to loading the whole file
+    ijson = None
+
+from storage.database import create_tables, get_session
+from storage.models import SimulationRun
+
+logger = logging.getLogger(__name__)
 
 # Create FastAPI app
 app = FastAPI(title="Emergence Simulator - Historical Viewer")
@@ -37,10 +63,28 @@ STATIC_DIR.mkdir(exist_ok=True)
 # Mount static files - point directly to visualization directory
 app.mount("/static", StaticFiles(directory=str(VIZ_DIR)), name="static")
 
+# Chart renders in flight, keyed by output filename
+_inflight = {}
+_inflight_lock = asyncio.Lock()
+# pyplot keeps global figure state, so worker-thread renders take turns
+_render_lock = threading.Lock()
+# Cleared figures kept for reuse by single-axes charts
+_FIG_POOL = queue.Queue(maxsize=4)
+
 # Configure matplotlib style
 plt.style.use('seaborn-v0_8' if 'seaborn-v0_8' in plt.style.available else 'default')
 sns.set_palette("husl")
 
+# Initialize database tables on startup
+@app.on_event("startup")
+async def startup_event():
+    """Initialize database tables"""
+    try:
+        create_tables()
+        print("✅ Database tables initialized")
+    except Exception as e:
+        print(f"❌ Error initializing database: {e}")
+
 @app.get("/")
 async def root():
     return {"message": "Historical Viewer API", "status": "running"}
@@ -483,8 +527,11 @@ async def load_simulation(path: str):
 # Utility functions for visualization
 def generate_cache_key(data):
     """Generate cache key from data"""
-    content = json.dumps(data, sort_keys=True)
-    return hashlib.md5(content.encode()).hexdigest()
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        content = json.dumps(data, sort_keys=True).encode()
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
 
 def load_simulation_data(path):
     """Load simulation data from file"""
@@ -492,27 +539,204 @@ def load_simulation_data(path):
     if not file_path.is_absolute():
         file_path = Path.cwd() / file_path
 
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    if orjson is not None:
+        raw = file_path.read_bytes()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump writes for floats
+            data = json.loads(raw)
+    else:
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+
+    # Flatten per-generation populations once so charts can use the array directly
+    if 'population_history' not in data and 'generation_data' in data:
+        data['population_history'] = np.fromiter(
+            (gen.get('population', 0) for gen in data['generation_data']),
+            dtype=np.int32, count=len(data['generation_data'])
+        )
+
+    return data
+
+def load_simulation_summary(path):
+    """Load only the fields the overview charts need from a results file
+
+    Streams the file with ijson, keeping per-generation populations and a
+    count of morphic influences without building the full generation_data
+    and morphic_influences lists. Falls back to a full load without ijson
+    or when ijson cannot parse the file.
+    """
+    if ijson is None:
+        return load_simulation_data(path)
+
+    file_path = Path(path)
+    if not file_path.is_absolute():
+        file_path = Path.cwd() / file_path
+
+    try:
+        return _stream_simulation_summary(file_path)
+    except ijson.JSONError:
+        # ijson rejects NaN/Infinity too; the full load handles them
+        return load_simulation_data(file_path)
+
+def _stream_simulation_summary(file_path):
+    """Build a results file summary from ijson parse events"""
+    summary = {}
+    population_history = None
+    generation_populations = None
+    has_population = False
+    influence_count = None
+
+    with open(file_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in ('generations', 'grid_size', 'final_population') and event == 'number':
+                summary[prefix] = int(value)
+            elif prefix == 'population_history':
+                if event == 'start_array':
+                    population_history = []
+            elif prefix == 'population_history.item' and event == 'number':
+                population_history.append(int(value))
+            elif prefix == 'generation_data' and event == 'start_array':
+                generation_populations = []
+            elif prefix == 'generation_data.item' and event == 'start_map':
+                has_population = False
+            elif prefix == 'generation_data.item.population' and event == 'number':
+                generation_populations.append(int(value))
+                has_population = True
+            elif prefix == 'generation_data.item' and event == 'end_map' and not has_population:
+                # Match load_simulation_data, which counts a missing population as 0
+                generation_populations.append(0)
+            elif prefix == 'morphic_influences' and event == 'start_array':
+                influence_count = 0
+            elif prefix == 'morphic_influences.item' and event in ('start_map', 'start_array', 'number', 'string'):
+                influence_count += 1
+
+    if population_history is None and generation_populations is not None:
+        population_history = generation_populations
+    if population_history is not None:
+        summary['population_history'] = population_history
+    if influence_count is not None:
+        summary['morphic_influence_count'] = influence_count
+
+    return summary
+
+async def load_simulation_summaries(paths):
+    """Load summaries of several simulation files concurrently off the event loop
+
+    Returns one entry per path, holding the exception instead of the summary
+    for files that could not be read.
+    """
+    return await asyncio.gather(
+        *[asyncio.to_thread(load_simulation_summary, path) for path in paths],
+        return_exceptions=True
+    )
+
+async def load_recent_runs(limit=10):
+    """Load summaries of the most recent simulation runs
+
+    Summary columns are read from the simulation_runs table. Rows written
+    before those columns existed are filled in from their results file the
+    first time they are read, or given an empty history if that file can't
+    be summarized so it isn't read again. Falls back to scanning results/
+    when no recorded run has a population history.
+    """
+    runs = []
+    session = get_session()
+    # Runs are read after the session closes, so don't expire them on backfill
+    session.expire_on_commit = False
+    try:
+        query = (session.query(SimulationRun)
+                 .filter(SimulationRun.results_path.isnot(None))
+                 .order_by(SimulationRun.created_at.desc())
+                 .limit(limit))
+        recorded = query.all()
+
+        missing = [run for run in recorded if run.population_history is None]
+        if missing:
+            results = await load_simulation_summaries([run.results_path for run in missing])
+            for run, data in zip(missing, results):
+                if not isinstance(data, Exception):
+                    run.apply_results_summary(data)
+                if run.population_history is None:
+                    # Nothing to backfill from; store an empty history so
+                    # later requests don't retry the file
+                    run.population_history = []
+            session.commit()
+
+        runs = [run for run in recorded if run.population_history]
+    except Exception:
+        logger.exception("Failed to load recent runs from the database")
+        session.rollback()
+    finally:
+        session.close()
+
+    if runs:
+        return runs
+
+    # No recorded runs - summarize loose result files instead
+    results_dir = Path("results")
+    if results_dir.exists():
+        sim_files = list(islice(results_dir.glob("simulation_*.json"), limit))
+        results = await load_simulation_summaries(sim_files)
+        for sim_file, data in zip(sim_files, results):
+            if isinstance(data, Exception):
+                continue
+            run = SimulationRun(
+                simulation_type='morphic' if 'morphic' in sim_file.name else 'control',
+                results_path=str(sim_file)
+            )
+            run.apply_results_summary(data)
+            runs.append(run)
+
+    return runs
+
+def _acquire_fig(figsize):
+    """Get a figure with a single axes, reusing a pooled figure when one is free"""
+    try:
+        fig = _FIG_POOL.get_nowait()
+    except queue.Empty:
+        return plt.subplots(figsize=figsize)
+
+    fig.set_size_inches(figsize)
+    return fig, fig.add_subplot(111)
+
+def _release_fig(fig):
+    """Clear a figure and return it to the pool, closing it if the pool is full"""
+    fig.clear()
+    try:
+        _FIG_POOL.put_nowait(fig)
+    except queue.Full:
+        plt.close(fig)
+
+def compute_influence_rates(data_list):
+    """Morphic influence rate (%) for each simulation, NaN where inputs are missing
+
+    Gathers influence counts and grid dimensions into arrays so the rates
+    come out of one NumPy expression rather than a per-simulation loop.
+    """
+    required = ('morphic_influences', 'generations', 'grid_size')
+    complete = [all(key in data for key in required) for data in data_list]
+
+    counts = np.array([len(data['morphic_influences']) if ok else np.nan
+                       for data, ok in zip(data_list, complete)], dtype=np.float64)
+    generations = np.array([data['generations'] if ok else np.nan
+                            for data, ok in zip(data_list, complete)], dtype=np.float64)
+    grid_sizes = np.array([data['grid_size'] if ok else np.nan
+                           for data, ok in zip(data_list, complete)], dtype=np.float64)
+
+    return counts / (generations * grid_sizes * grid_sizes) * 100.0
 
 def create_population_chart(data, title="Population Over Time"):
     """Create population progression chart"""
-    population_data = None
-
-    # Try different possible data structures
-    if 'population_history' in data:
-        population_data = data['population_history']
-    elif 'generation_data' in data:
-        # Extract population from generation data
-        population_data = [gen.get('population', 0) for gen in data['generation_data']]
-    else:
+    if 'population_history' not in data:
         return None
+    population_data = data['population_history']
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-    generations = list(range(len(population_data)))
-    populations = population_data
+    fig, ax = _acquire_fig((12, 6))
+    generations = np.arange(len(population_data))
 
-    ax.plot(generations, populations, linewidth=2, marker='o', markersize=4)
+    ax.plot(generations, population_data, linewidth=2, marker='o', markersize=4)
     ax.set_xlabel('Generation')
     ax.set_ylabel('Population')
     ax.set_title(title)
@@ -533,7 +757,7 @@ def create_population_chart(data, title="Population Over Time"):
             ax2.set_ylabel('Morphic Influences', color='red')
             ax2.legend()
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 def create_comparison_chart(data_list, titles):
@@ -543,15 +767,10 @@ def create_comparison_chart(data_list, titles):
     # Population comparison
     ax = axes[0, 0]
     for i, (data, title) in enumerate(zip(data_list, titles)):
-        population_data = None
-        if 'population_history' in data:
-            population_data = data['population_history']
-        elif 'generation_data' in data:
-            population_data = [gen.get('population', 0) for gen in data['generation_data']]
-
-        if population_data:
-            generations = list(range(len(population_data)))
-            ax.plot(generations, population_data, label=title, linewidth=2)
+        population_data = data.get('population_history')
+
+        if population_data is not None and len(population_data):
+            ax.plot(np.arange(len(population_data)), population_data, label=title, linewidth=2)
     ax.set_xlabel('Generation')
     ax.set_ylabel('Population')
     ax.set_title('Population Comparison')
@@ -560,16 +779,12 @@ def create_comparison_chart(data_list, titles):
 
     # Morphic influence comparison
     ax = axes[0, 1]
-    morphic_rates = []
-    labels = []
-    for data, title in zip(data_list, titles):
-        if 'morphic_influences' in data and 'generations' in data and 'grid_size' in data:
-            total_decisions = data['generations'] * data['grid_size'] * data['grid_size']
-            rate = (len(data['morphic_influences']) / total_decisions) * 100
-            morphic_rates.append(rate)
-            labels.append(title[:20])  # Truncate long titles
-
-    if morphic_rates:
+    rates = compute_influence_rates(data_list)
+    has_rate = ~np.isnan(rates)
+    morphic_rates = rates[has_rate]
+    labels = [title[:20] for title, ok in zip(titles, has_rate) if ok]  # Truncate long titles
+
+    if len(morphic_rates):
         bars = ax.bar(labels, morphic_rates, alpha=0.7)
         ax.set_ylabel('Morphic Influence Rate (%)')
         ax.set_title('Morphic Influence Comparison')
@@ -616,7 +831,7 @@ def create_comparison_chart(data_list, titles):
             ax.text(bar.get_x() + bar.get_width()/2., height,
                    f'{count}', ha='center', va='bottom')
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 def create_morphic_heatmap(data):
@@ -645,6 +860,101 @@ def create_morphic_heatmap(data):
 
     return fig
 
+def create_population_trends_chart(runs):
+    """Create population trends chart for several simulation runs"""
+    fig, ax = _acquire_fig((12, 8))
+
+    # Draw every run as one LineCollection rather than one Line2D per run
+    segments = []
+    labels = []
+    for run in runs:
+        if run.population_history:
+            population = np.asarray(run.population_history)
+            segments.append(np.column_stack([np.arange(len(population)), population]))
+            labels.append(f"{Path(run.results_path).stem[-8:]}") # Last 8 chars (timestamp)
+
+    if segments:
+        colors = plt.cm.viridis(np.linspace(0, 1, len(segments)))
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=1, alpha=0.7,
+                                         rasterized=True))
+        ax.autoscale()
+
+        # Legend from proxy artists, one per run
+        handles = [Line2D([], [], color=color, linewidth=1, alpha=0.7) for color in colors]
+        ax.legend(handles, labels, bbox_to_anchor=(1.05, 1), loc='upper left')
+
+    ax.set_xlabel('Generation')
+    ax.set_ylabel('Population')
+    ax.set_title('Population Trends - Recent Simulations')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+def create_influence_distribution_chart(runs):
+    """Create histogram of morphic influence rates, morphic vs control"""
+    rated = [run for run in runs if run.morphic_influence_rate is not None]
+    rates = np.fromiter((run.morphic_influence_rate for run in rated), dtype=np.float64, count=len(rated))
+    is_morphic = np.fromiter((run.simulation_type == 'morphic' for run in rated), dtype=bool, count=len(rated))
+    morphic_data = rates[is_morphic]
+    control_data = rates[~is_morphic]
+
+    if not len(morphic_data):
+        return None
+
+    fig, ax = _acquire_fig((10, 6))
+
+    ax.hist(morphic_data, bins=10, alpha=0.7, label='Morphic Simulations', color='blue',
+            rasterized=True)
+    if len(control_data):
+        ax.hist(control_data, bins=10, alpha=0.7, label='Control Simulations', color='red',
+                rasterized=True)
+
+    ax.set_xlabel('Morphic Influence Rate (%)')
+    ax.set_ylabel('Frequency')
+    ax.set_title('Distribution of Morphic Influence Rates')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+def _render_chart(chart_path, create_chart, *args):
+    """Create a chart and save it to chart_path, returning False if there was nothing to plot"""
+    with _render_lock:
+        fig = create_chart(*args)
+        if fig is None:
+            return False
+        try:
+            fig.savefig(chart_path, dpi=80)
+        finally:
+            _release_fig(fig)
+        return True
+
+async def save_chart_once(chart_path, create_chart, *args):
+    """Render a chart in a worker thread, sharing one render per output file
+
+    Concurrent requests for the same chart wait for the render already in
+    flight instead of drawing and overwriting the same file again.
+    """
+    key = chart_path.name
+    async with _inflight_lock:
+        event = _inflight.get(key)
+        if event is None:
+            event = _inflight[key] = asyncio.Event()
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        await event.wait()
+        return chart_path.exists()
+
+    try:
+        return await asyncio.to_thread(_render_chart, chart_path, create_chart, *args)
+    finally:
+        async with _inflight_lock:
+            del _inflight[key]
+        event.set()
+
 # API endpoints for comparison and visualization
 @app.post("/api/simulations/compare")
 async def compare_simulations(request: dict):
@@ -668,9 +978,7 @@ async def compare_simulations(request: dict):
 
         # Generate visualization if not cached
         if not viz_path.exists():
-            fig = create_comparison_chart(data_list, titles)
-            fig.savefig(viz_path, dpi=150, bbox_inches='tight')
-            plt.close(fig)
+            await save_chart_once(viz_path, create_comparison_chart, data_list, titles)
 
         # Extract metrics for comparison
         metrics = {}
@@ -680,16 +988,10 @@ async def compare_simulations(request: dict):
             metrics[metric] = [data.get(metric, 0) for data in data_list]
 
         # Add morphic influence rates
-        morphic_rates = []
-        for data in data_list:
-            if 'morphic_influences' in data and 'generations' in data and 'grid_size' in data:
-                total_decisions = data['generations'] * data['grid_size'] * data['grid_size']
-                rate = (len(data['morphic_influences']) / total_decisions) * 100
-                morphic_rates.append(f"{rate:.1f}%")
-            else:
-                morphic_rates.append("N/A")
-
-        metrics['morphic_influence_rate'] = morphic_rates
+        metrics['morphic_influence_rate'] = [
+            "N/A" if np.isnan(rate) else f"{rate:.1f}%"
+            for rate in compute_influence_rates(data_list)
+        ]
 
         return {
             "metrics": metrics,
@@ -712,94 +1014,87 @@ async def generate_overview_visualizations(request: dict):
 
         charts = []
 
-        # Load recent simulations
-        results_dir = Path("results")
-        if results_dir.exists():
-            sim_files = list(results_dir.glob("simulation_*.json"))[:10]  # Last 10 simulations
-
-            if sim_files:
-                # Population trends chart
-                pop_chart_path = VIZ_DIR / f"population_trends_{cache_key}.png"
-                if not pop_chart_path.exists() or refresh:
-                    fig, ax = plt.subplots(figsize=(12, 8))
-
-                    for i, sim_file in enumerate(sim_files):
-                        try:
-                            data = load_simulation_data(sim_file)
-                            population_data = None
-                            if 'population_history' in data:
-                                population_data = data['population_history']
-                            elif 'generation_data' in data:
-                                population_data = [gen.get('population', 0) for gen in data['generation_data']]
-
-                            if population_data:
-                                generations = list(range(len(population_data)))
-                                label = f"{sim_file.stem[-8:]}" # Last 8 chars (timestamp)
-                                ax.plot(generations, population_data,
-                                       label=label, alpha=0.7, linewidth=1)
-                        except Exception:
-                            continue
-
-                    ax.set_xlabel('Generation')
-                    ax.set_ylabel('Population')
-                    ax.set_title('Population Trends - Recent Simulations')
-                    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-                    ax.grid(True, alpha=0.3)
-                    plt.tight_layout()
-                    fig.savefig(pop_chart_path, dpi=150, bbox_inches='tight')
-                    plt.close(fig)
-
-                charts.append({
-                    "title": "Population Trends",
-                    "url": f"/static/{pop_chart_path.name}"
-                })
-
-                # Morphic influence distribution
-                influence_chart_path = VIZ_DIR / f"morphic_distribution_{cache_key}.png"
-                if not influence_chart_path.exists() or refresh:
-                    morphic_data = []
-                    control_data = []
-
-                    for sim_file in sim_files:
-                        try:
-                            data = load_simulation_data(sim_file)
-                            if 'morphic_influences' in data and 'generations' in data and 'grid_size' in data:
-                                total_decisions = data['generations'] * data['grid_size'] * data['grid_size']
-                                rate = (len(data['morphic_influences']) / total_decisions) * 100
-
-                                if 'morphic' in sim_file.name:
-                                    morphic_data.append(rate)
-                                else:
-                                    control_data.append(rate)
-                        except Exception:
-                            continue
-
-                    if morphic_data:
-                        fig, ax = plt.subplots(figsize=(10, 6))
-
-                        ax.hist(morphic_data, bins=10, alpha=0.7, label='Morphic Simulations', color='blue')
-                        if control_data:
-                            ax.hist(control_data, bins=10, alpha=0.7, label='Control Simulations', color='red')
-
-                        ax.set_xlabel('Morphic Influence Rate (%)')
-                        ax.set_ylabel('Frequency')
-                        ax.set_title('Distribution of Morphic Influence Rates')
-                        ax.legend()
-                        ax.grid(True, alpha=0.3)
-                        plt.tight_layout()
-                        fig.savefig(influence_chart_path, dpi=150, bbox_inches='tight')
-                        plt.close(fig)
-
-                        charts.append({
-                            "title": "Morphic Influence Distribution",
-                            "url": f"/static/{influence_chart_path.name}"
-                        })
+        # Load recent simulation summaries
+        runs = await load_recent_runs(limit=10)
+
+        if runs:
+            # Population trends chart
+            pop_chart_path = VIZ_DIR / f"population_trends_{cache_key}.png"
+            if not pop_chart_path.exists() or refresh:
+                await save_chart_once(pop_chart_path, create_population_trends_chart, runs)
+
+            charts.append({
+                "title": "Population Trends",
+                "url": f"/static/{pop_chart_path.name}"
+            })
+
+            # Morphic influence distribution
+            influence_chart_path = VIZ_DIR / f"morphic_distribution_{cache_key}.png"
+            if not influence_chart_path.exists() or refresh:
+                if await save_chart_once(influence_chart_path, create_influence_distribution_chart, runs):
+                    charts.append({
+                        "title": "Morphic Influence Distribution",
+                        "url": f"/static/{influence_chart_path.name}"
+                    })
 
         return {"charts": charts}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating visualizations: {str(e)}")
 
+@app.post("/api/visualizations/interactive")
+async def generate_interactive_visualizations(request: dict):
+    """Generate overview charts as Plotly figure JSON for client-side rendering
+
+    Skips matplotlib and PNG encoding entirely; the browser draws the
+    charts from the returned figure specs.
+    """
+    try:
+        runs = await load_recent_runs(limit=10)
+        charts = []
+
+        if runs:
+            # All runs share one trace, with None gaps separating the lines
+            xs, ys, labels = [], [], []
+            for run in runs:
+                if run.population_history:
+                    label = f"{Path(run.results_path).stem[-8:]}" # Last 8 chars (timestamp)
+                    xs.extend(range(len(run.population_history)))
+                    ys.extend(run.population_history)
+                    labels.extend([label] * len(run.population_history))
+                    xs.append(None)
+                    ys.append(None)
+                    labels.append(None)
+
+            trends = go.Figure(go.Scatter(
+                x=xs, y=ys, text=labels, mode='lines', line=dict(width=1), opacity=0.7,
+                hovertemplate='%{text}<br>Generation %{x}<br>Population %{y}<extra></extra>'
+            ))
+            trends.update_layout(title='Population Trends - Recent Simulations',
+                                 xaxis_title='Generation', yaxis_title='Population')
+            charts.append({"title": "Population Trends", "figure": trends})
+
+            rated = [run for run in runs if run.morphic_influence_rate is not None]
+            morphic_data = [run.morphic_influence_rate for run in rated if run.simulation_type == 'morphic']
+            control_data = [run.morphic_influence_rate for run in rated if run.simulation_type != 'morphic']
+
+            if morphic_data:
+                distribution = go.Figure()
+                distribution.add_trace(go.Histogram(x=morphic_data, nbinsx=10, opacity=0.7,
+                                                    name='Morphic Simulations', marker_color='blue'))
+                if control_data:
+                    distribution.add_trace(go.Histogram(x=control_data, nbinsx=10, opacity=0.7,
+                                                        name='Control Simulations', marker_color='red'))
+                distribution.update_layout(title='Distribution of Morphic Influence Rates', barmode='overlay',
+                                           xaxis_title='Morphic Influence Rate (%)', yaxis_title='Frequency')
+                charts.append({"title": "Morphic Influence Distribution", "figure": distribution})
+
+        return Response(content=json.dumps({"charts": charts}, cls=PlotlyJSONEncoder),
+                        media_type="application/json")
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating interactive visualizations: {str(e)}")
+
 @app.post("/api/visualizations/single")
 async def generate_single_visualization(request: dict):
     """Generate visualization for a single simulation"""
@@ -816,11 +1111,7 @@ async def generate_single_visualization(request: dict):
         viz_path = VIZ_DIR / f"single_{cache_key}.png"
 
         if not viz_path.exists():
-            fig = create_population_chart(data, f"Population: {sim_name}")
-            if fig:
-                fig.savefig(viz_path, dpi=150, bbox_inches='tight')
-                plt.close(fig)
-            else:
+            if not await save_chart_once(viz_path, create_population_chart, data, f"Population: {sim_name}"):
                 raise HTTPException(status_code=400, detail="No population data available for visualization")
 
         return {
@@ -8,12 +8,14 @@ and appropriate engine configuration.
 
 import os
 import logging
+import functools
+import weakref
 from typing import Optional, Union
 from pathlib import Path
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
 # Load environment variables from .env file
 try:
@@ -27,7 +29,20 @@ logger = logging.getLogger(__name__)
 
 # Base for SQLAlchemy models
 Base = declarative_base()
-metadata = MetaData()
+
+# Engines whose tables have already been created in this process
+_tables_created = weakref.WeakSet()
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for concurrent dashboard reads"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.close()
+
 
 class DatabaseConfig:
     """Database configuration and connection management"""
@@ -69,32 +84,45 @@ class DatabaseConfig:
     def _setup_sqlite(self):
         """Configure SQLite engines"""
         logger.info(f"Configuring SQLite database: {self.database_url}")
-        
+
+        # An in-memory database only exists on its own connection, so it needs
+        # StaticPool. File databases use WAL, which lets pooled readers run
+        # alongside a writer.
+        in_memory = ":memory:" in self.database_url or self.database_url.rstrip("/") == "sqlite:"
+        if in_memory:
+            pool_args = {"poolclass": StaticPool}
+            async_pool_args = {"poolclass": StaticPool}
+        else:
+            pool_args = {"poolclass": QueuePool, "pool_size": 5}
+            async_pool_args = {"poolclass": AsyncAdaptedQueuePool, "pool_size": 5}
+
         # Synchronous SQLite engine
         self.engine = create_engine(
             self.database_url,
             echo=False,
-            poolclass=StaticPool,
             connect_args={
                 "check_same_thread": False,  # Allow SQLite to be used across threads
-            }
+            },
+            **pool_args
         )
-        
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
+
         # Async SQLite engine (using aiosqlite)
         async_url = self.database_url.replace("sqlite:", "sqlite+aiosqlite:")
         self.async_engine = create_async_engine(
             async_url,
             echo=False,
-            poolclass=StaticPool,
-            connect_args={"check_same_thread": False}
+            connect_args={"check_same_thread": False},
+            **async_pool_args
         )
-        
+        event.listen(self.async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
         # Session makers
         self.SessionLocal = sessionmaker(bind=self.engine)
         self.AsyncSessionLocal = sessionmaker(
             self.async_engine, class_=AsyncSession, expire_on_commit=False
         )
-        
+
     def _setup_postgres(self):
         """Configure PostgreSQL engines"""
         logger.info(f"Configuring PostgreSQL database: {self.database_url}")
@@ -134,8 +162,15 @@ class DatabaseConfig:
             self.async_engine, class_=AsyncSession, expire_on_commit=False
         )
         
-    def create_tables(self):
-        """Create all database tables"""
+    def create_tables(self, force: bool = False):
+        """Create all database tables, once per engine unless forced"""
+        if self.engine in _tables_created and not force:
+            return
+
+        # Register every model on Base.metadata before creating anything, so
+        # the engine is never marked done with an empty schema
+        from . import models  # noqa: F401
+
         logger.info("Creating database tables...")
         
         if self.is_sqlite:
@@ -144,11 +179,21 @@ class DatabaseConfig:
             db_path.parent.mkdir(parents=True, exist_ok=True)
             
         # Create tables
-        Base.metadata.create_all(bind=self.engine)
+        with self.engine.begin() as conn:
+            Base.metadata.create_all(bind=conn)
+            self._add_missing_columns(conn)
+            self._add_missing_indexes(conn)
+        _tables_created.add(self.engine)
         logger.info("Database tables created successfully")
         
-    async def create_tables_async(self):
-        """Create all database tables asynchronously"""
+    async def create_tables_async(self, force: bool = False):
+        """Create all database tables asynchronously, once per engine unless forced"""
+        # Both engines point at the same database, so either path marks it done
+        if self.engine in _tables_created and not force:
+            return
+
+        from . import models  # noqa: F401
+
         logger.info("Creating database tables (async)...")
         
         if self.is_sqlite:
@@ -159,8 +204,48 @@ class DatabaseConfig:
         # Create tables
         async with self.async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(self._add_missing_columns)
+            await conn.run_sync(self._add_missing_indexes)
+        _tables_created.add(self.engine)
         logger.info("Database tables created successfully (async)")
         
+    @staticmethod
+    def _add_missing_columns(conn):
+        """Add model columns that are absent from existing tables.
+
+        ``create_all`` only creates missing tables, so databases created
+        before a column was added to a model would otherwise fail on query.
+        Only nullable columns are expected here.
+        """
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {col['name'] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=conn.dialect)
+                logger.info(f"Adding column {table.name}.{column.name} ({column_type})")
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+
+    @staticmethod
+    def _add_missing_indexes(conn):
+        """Create model indexes that are absent from existing tables"""
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    logger.info(f"Creating index {index.name} on {table.name}")
+                    index.create(bind=conn)
+
     def get_session(self):
         """Get a synchronous database session"""
         return self.SessionLocal()
@@ -198,37 +283,41 @@ class DatabaseConfig:
         }
 
 
-# Global database configuration instance
-db_config = DatabaseConfig()
+# Global database configuration, created on first use so importing
+# storage doesn't build engines for callers that never touch the database
+@functools.lru_cache(maxsize=1)
+def db_config() -> DatabaseConfig:
+    """Get the shared database configuration instance"""
+    return DatabaseConfig()
 
 # Convenience functions
 def get_engine():
     """Get the synchronous database engine"""
-    return db_config.engine
+    return db_config().engine
 
 def get_async_engine():
     """Get the asynchronous database engine"""
-    return db_config.async_engine
+    return db_config().async_engine
     
 def get_session():
     """Get a synchronous database session"""
-    return db_config.get_session()
+    return db_config().get_session()
     
 def get_async_session():
     """Get an asynchronous database session"""
-    return db_config.get_async_session()
+    return db_config().get_async_session()
     
-def create_tables():
-    """Create all database tables"""
-    return db_config.create_tables()
+def create_tables(force: bool = False):
+    """Create all database tables; force re-runs it after a drop"""
+    return db_config().create_tables(force=force)
     
-async def create_tables_async():
-    """Create all database tables asynchronously"""
-    return await db_config.create_tables_async()
+async def create_tables_async(force: bool = False):
+    """Create all database tables asynchronously; force re-runs it after a drop"""
+    return await db_config().create_tables_async(force=force)
 
 def get_database_info() -> dict:
     """Get database configuration information"""
-    return db_config.database_info
+    return db_config().database_info
 
 
 if __name__ == "__main__":
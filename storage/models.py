@@ -6,17 +6,31 @@ Defines SQLAlchemy models for storing simulation runs, integrated runs,
 and associated metadata.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from storage.database import Base
+import itertools
+import re
+import time
 import uuid
 from datetime import datetime
 
+# Characters not allowed in URL slugs
+_SLUG_RE = re.compile(r'[^a-z0-9-]')
+_UUID4 = uuid.uuid4
+# Process-local sequence that keeps slug suffixes distinct within a process
+_SLUG_COUNTER = itertools.count()
+
 
 class SimulationRun(Base):
     """Individual simulation run record"""
     __tablename__ = "simulation_runs"
+    __table_args__ = (
+        # The overview lists the newest runs that have a results file; carrying
+        # results_path lets SQLite filter while walking the index newest first
+        Index("ix_sim_created_results", "created_at", "results_path"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     run_id = Column(String(50), unique=True, nullable=False, index=True)
@@ -33,10 +47,38 @@ class SimulationRun(Base):
     results_path = Column(String(500))  # Path to results JSON file
     animation_path = Column(String(500))  # Path to animation file
 
+    # Denormalized summary of the results file so charts don't have to reopen it
+    grid_size = Column(Integer)
+    morphic_influence_rate = Column(Float)  # Percentage of cell decisions influenced
+    population_history = Column(JSON)  # Population per generation
+
     # Relationship to integrated runs
     integrated_run_id = Column(Integer, ForeignKey('integrated_runs.id'))
     integrated_run = relationship("IntegratedRun", back_populates="simulation_runs")
 
+    def apply_results_summary(self, results_data: dict):
+        """Copy summary fields from a parsed results JSON onto this run"""
+        if 'generations' in results_data:
+            self.generations = results_data['generations']
+        if 'final_population' in results_data:
+            self.final_population = results_data['final_population']
+        self.grid_size = results_data.get('grid_size')
+
+        if 'population_history' in results_data:
+            # May be a numpy array; store plain ints so the column serializes as JSON
+            self.population_history = [int(p) for p in results_data['population_history']]
+        elif 'generation_data' in results_data:
+            self.population_history = [gen.get('population', 0) for gen in results_data['generation_data']]
+
+        # Streamed summaries carry a count instead of the influence list itself
+        influence_count = results_data.get('morphic_influence_count')
+        if influence_count is None and 'morphic_influences' in results_data:
+            influence_count = len(results_data['morphic_influences'])
+
+        if influence_count is not None and self.generations and self.grid_size:
+            total_decisions = self.generations * self.grid_size * self.grid_size
+            self.morphic_influence_rate = (influence_count / total_decisions) * 100
+
 
 class IntegratedRun(Base):
     """Integrated run combining multiple simulation types"""
@@ -93,6 +135,10 @@ class ComparisonFrame(Base):
 class MorphicEvent(Base):
     """Track morphic resonance events for educational purposes"""
     __tablename__ = "morphic_events"
+    __table_args__ = (
+        # Events are read per simulation run in generation order
+        Index("ix_morphic_sim_gen", "simulation_run_id", "generation"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     simulation_run_id = Column(Integer, ForeignKey('simulation_runs.id'))
@@ -121,8 +167,7 @@ def generate_unique_slug(base_slug: str = None) -> str:
         # Clean and format the base slug
         slug = base_slug.lower().replace(' ', '-').replace('_', '-')
         # Remove special characters
-        import re
-        slug = re.sub(r'[^a-z0-9\-]', '', slug)
+        slug = _SLUG_RE.sub('', slug)
         # Ensure it doesn't start or end with dash
         slug = slug.strip('-')
         if not slug:
@@ -130,16 +175,18 @@ def generate_unique_slug(base_slug: str = None) -> str:
     else:
         slug = "run"
 
-    # Add timestamp for uniqueness
+    # Add timestamp for uniqueness. The suffix only has to separate slugs made
+    # in the same second, so a clock+counter mix avoids a urandom call; the
+    # unique constraint on slug catches collisions between processes.
     timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-    unique_id = str(uuid.uuid4())[:8]
+    unique_id = f"{(time.time_ns() + next(_SLUG_COUNTER)) & 0xFFFFFFFF:08x}"
 
     return f"{slug}-{timestamp}-{unique_id}"
 
 
 def generate_run_id() -> str:
     """Generate a unique run ID"""
-    return str(uuid.uuid4())
+    return str(_UUID4())
 
 
 if __name__ == "__main__":
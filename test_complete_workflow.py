@@ -3,14 +3,39 @@
 Complete workflow test for fixed integrated runs
 """
 
-import requests
-import time
-import json
+import re
+import httpx
 
+TIMEOUT = 10
 
-def test_complete_workflow():
+# Markers each page must contain, matched in one pass over the body. They are
+# all ASCII, so they are matched against the raw bytes without decoding.
+GALLERY_MARKERS = {b"Integrated Runs Gallery", b"gallery-grid"}
+RESULTS_MARKERS = {b"Analysis Complete", b"summary-grid"}
+CREATE_MARKERS = {b"integrated-run-form", b"simulation_types"}
+NAV_MARKERS = {b"/integrated-runs/create", b"/integrated-runs/gallery"}
+
+
+def _marker_regex(markers):
+    return re.compile(b"|".join(map(re.escape, sorted(markers))))
+
+
+GALLERY_RX = _marker_regex(GALLERY_MARKERS)
+RESULTS_RX = _marker_regex(RESULTS_MARKERS)
+CREATE_RX = _marker_regex(CREATE_MARKERS)
+NAV_RX = _marker_regex(NAV_MARKERS)
+
+
+def _has_markers(rx, markers, content):
+    """Check that every marker appears in content using a single regex sweep"""
+    return markers <= set(rx.findall(content))
+
+
+def test_complete_workflow(live_server, http_client):
     """Test the complete integrated runs workflow"""
-    base_url = "http://localhost:8005"  # Using the correct port
+    base_url = live_server
+    _get = http_client.get
+    failures = []
 
     print("🧪 Testing Complete Integrated Runs Workflow")
     print("=" * 60)
@@ -19,28 +44,30 @@ def test_complete_workflow():
     print("\n1️⃣ Testing Gallery Page")
     print("-" * 30)
     try:
-        response = requests.get(f"{base_url}/integrated-runs/gallery", timeout=10)
+        response = _get(f"{base_url}/integrated-runs/gallery")
         print(f"Gallery page: {response.status_code}")
         if response.status_code == 200:
             print("✅ Gallery page loads successfully")
             # Check if it contains expected HTML
-            content = response.text
-            if "Integrated Runs Gallery" in content and "gallery-grid" in content:
+            content = response.content
+            if _has_markers(GALLERY_RX, GALLERY_MARKERS, content):
                 print("✅ Gallery page contains expected content")
             else:
                 print("⚠️  Gallery page missing expected content")
         else:
             print(f"❌ Gallery page error: {response.status_code}")
             print(f"Response: {response.text[:200]}...")
+            failures.append(f"gallery page: {response.status_code}")
     except Exception as e:
         print(f"❌ Gallery page test failed: {e}")
+        failures.append(f"gallery page: {e}")
 
     # Test 2: API endpoints
     print("\n2️⃣ Testing API Endpoints")
     print("-" * 30)
     try:
         # Test list endpoint
-        response = requests.get(f"{base_url}/api/integrated-runs", timeout=10)
+        response = _get(f"{base_url}/api/integrated-runs")
         print(f"List API: {response.status_code}")
         if response.status_code == 200:
             data = response.json()
@@ -53,61 +80,73 @@ def test_complete_workflow():
                 slug = first_run['slug']
 
                 # Test status endpoint
-                status_response = requests.get(f"{base_url}/api/integrated-runs/{slug}/status", timeout=10)
+                status_response = _get(f"{base_url}/api/integrated-runs/{slug}/status")
                 print(f"Status API for {slug}: {status_response.status_code}")
                 if status_response.status_code == 200:
                     status_data = status_response.json()
                     print(f"✅ Status: {status_data['status']}, Progress: {status_data.get('progress', 0)*100:.0f}%")
+                else:
+                    failures.append(f"status API for {slug}: {status_response.status_code}")
 
                 # Test results page
-                results_response = requests.get(f"{base_url}/integrated-runs/{slug}", timeout=10)
+                results_response = _get(f"{base_url}/integrated-runs/{slug}")
                 print(f"Results page for {slug}: {results_response.status_code}")
                 if results_response.status_code == 200:
                     print("✅ Results page loads successfully")
                     # Check for enhanced content
-                    content = results_response.text
-                    if "Analysis Complete" in content and "summary-grid" in content:
+                    content = results_response.content
+                    if _has_markers(RESULTS_RX, RESULTS_MARKERS, content):
                         print("✅ Results page has enhanced content")
                     else:
                         print("⚠️  Results page may have basic content")
+                else:
+                    failures.append(f"results page for {slug}: {results_response.status_code}")
             else:
                 print("ℹ️  No runs to test individual pages")
+        else:
+            failures.append(f"list API: {response.status_code}")
     except Exception as e:
         print(f"❌ API test failed: {e}")
+        failures.append(f"API: {e}")
 
     # Test 3: Create page
     print("\n3️⃣ Testing Create Page")
     print("-" * 30)
     try:
-        response = requests.get(f"{base_url}/integrated-runs/create", timeout=10)
+        response = _get(f"{base_url}/integrated-runs/create")
         print(f"Create page: {response.status_code}")
         if response.status_code == 200:
             print("✅ Create page loads successfully")
-            content = response.text
-            if "integrated-run-form" in content and "simulation_types" in content:
+            content = response.content
+            if _has_markers(CREATE_RX, CREATE_MARKERS, content):
                 print("✅ Create page contains form elements")
             else:
                 print("⚠️  Create page missing expected form")
         else:
             print(f"❌ Create page error: {response.status_code}")
+            failures.append(f"create page: {response.status_code}")
     except Exception as e:
         print(f"❌ Create page test failed: {e}")
+        failures.append(f"create page: {e}")
 
     # Test 4: Navigation
     print("\n4️⃣ Testing Navigation")
     print("-" * 30)
     try:
         # Test main page links to integrated runs
-        response = requests.get(f"{base_url}/", timeout=10)
+        response = _get(f"{base_url}/")
         print(f"Main page: {response.status_code}")
         if response.status_code == 200:
-            content = response.text
-            if "/integrated-runs/create" in content and "/integrated-runs/gallery" in content:
+            content = response.content
+            if _has_markers(NAV_RX, NAV_MARKERS, content):
                 print("✅ Main page has integrated runs navigation")
             else:
                 print("⚠️  Main page missing integrated runs links")
+        else:
+            failures.append(f"main page: {response.status_code}")
     except Exception as e:
         print(f"❌ Navigation test failed: {e}")
+        failures.append(f"main page: {e}")
 
     # Test 5: Route order (critical fix)
     print("\n5️⃣ Testing Route Order Fix")
@@ -119,16 +158,21 @@ def test_complete_workflow():
         "/integrated-runs/create"
     ]
 
-    for endpoint in gallery_tests:
+    urls = [base_url + endpoint for endpoint in gallery_tests]
+    for endpoint, url in zip(gallery_tests, urls):
         try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
+            response = _get(url)
             print(f"{endpoint}: {response.status_code}")
             if response.status_code == 200:
                 print(f"✅ {endpoint} works correctly")
             else:
                 print(f"❌ {endpoint} failed: {response.text[:100]}")
+                failures.append(f"{endpoint}: {response.status_code}")
         except Exception as e:
             print(f"❌ {endpoint} error: {e}")
+            failures.append(f"{endpoint}: {e}")
+
+    assert not failures, f"Workflow checks failed: {failures}"
 
     print("\n🎯 Summary")
     print("=" * 60)
@@ -140,4 +184,5 @@ def test_complete_workflow():
 
 
 if __name__ == "__main__":
-    test_complete_workflow()
\ No newline at end of file
+    with httpx.Client(timeout=TIMEOUT) as client:
+        test_complete_workflow("http://localhost:8005", client)
\ No newline at end of file
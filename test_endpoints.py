@@ -3,14 +3,72 @@
 Test all integrated runs endpoints to verify they work correctly
 """
 
-import requests
-import json
-import time
-from pathlib import Path
+import asyncio
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+import socket
+
+try:
+    import ijson
+except ImportError:
+    # ijson not available, fall back to parsing the whole response
+    ijson = None
+
+TIMEOUT = 5
+PORT_TIMEOUT = 2
+
+def _probe(client, url, timeout=TIMEOUT):
+    """GET a URL, returning the response or the exception it raised"""
+    try:
+        return url, client.get(url, timeout=timeout)
+    except Exception as e:
+        return url, e
+
+def _first_runs(response, keep=3):
+    """Count the runs in a list response, keeping only the first few
+
+    Streams the body with ijson so runs past ``keep`` are never held at once.
+    """
+    if ijson is None:
+        response.read()
+        runs = response.json()['runs']
+        return len(runs), runs[:keep]
+
+    count, first = 0, []
+    parsed = ijson.sendable_list()
+    parser = ijson.items_coro(parsed, "runs.item")
+    for chunk in response.iter_bytes():
+        parser.send(chunk)
+        for run in parsed:
+            if count < keep:
+                first.append(run)
+            count += 1
+        del parsed[:]
+    parser.close()
+    return count, first
+
+def _port_open(host, port, timeout=0.05):
+    """Cheap TCP connect check so dead ports never reach the HTTP stack"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex((host, port)) == 0
+
+async def _check_health(client, port):
+    """GET /health on a port, returning the response or the exception it raised"""
+    try:
+        return port, await client.get(f"http://localhost:{port}/health")
+    except Exception as e:
+        return port, e
+
+async def _check_ports(ports, timeout=PORT_TIMEOUT):
+    """Probe /health on every port concurrently from one event loop"""
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        return dict(await asyncio.gather(*[_check_health(client, port) for port in ports]))
 
-def test_endpoints():
+def test_endpoints(live_server, http_client):
     """Test all integrated runs endpoints"""
-    base_url = "http://localhost:8000"
+    base_url = live_server
+    failures = []
 
     print("🧪 Testing Integrated Runs Endpoints")
     print("=" * 50)
@@ -19,25 +77,19 @@ def test_endpoints():
     print("\n📡 Testing API Endpoints")
     print("-" * 30)
 
-    try:
-        # Test list endpoint
-        response = requests.get(f"{base_url}/api/integrated-runs", timeout=5)
+    runs = []
+    # Test list endpoint
+    with http_client.stream("GET", f"{base_url}/api/integrated-runs") as response:
         print(f"GET /api/integrated-runs: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
-            print(f"  Found {len(data['runs'])} runs")
-            for run in data['runs'][:3]:
+            count, runs = _first_runs(response)
+            print(f"  Found {count} runs")
+            for run in runs:
                 print(f"    - {run['slug']} ({run['status']})")
         else:
+            response.read()
             print(f"  Error: {response.text}")
-
-    except requests.exceptions.ConnectionError:
-        print("❌ Server not running on port 8000")
-        print("💡 Start server with: ./venv/bin/python main.py")
-        return False
-    except Exception as e:
-        print(f"❌ API Error: {e}")
-        return False
+            failures.append(f"/api/integrated-runs: {response.status_code}")
 
     # Test frontend endpoints
     print("\n🌐 Testing Frontend Endpoints")
@@ -50,75 +102,86 @@ def test_endpoints():
         "/health"
     ]
 
-    for endpoint in endpoints:
-        try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            print(f"GET {endpoint}: {response.status_code}")
-            if response.status_code != 200:
-                print(f"  Error: {response.text[:100]}...")
-        except Exception as e:
-            print(f"GET {endpoint}: ERROR - {e}")
+    # The pages are independent, so fetch them concurrently
+    urls = [base_url + endpoint for endpoint in endpoints]
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        results = list(pool.map(lambda url: _probe(http_client, url), urls))
+
+    for endpoint, (_, response) in zip(endpoints, results):
+        if isinstance(response, Exception):
+            print(f"GET {endpoint}: ERROR - {response}")
+            failures.append(f"{endpoint}: {response}")
+            continue
+        print(f"GET {endpoint}: {response.status_code}")
+        if response.status_code != 200:
+            print(f"  Error: {response.text[:100]}...")
+            failures.append(f"{endpoint}: {response.status_code}")
 
     # Test specific run page
     print("\n🔍 Testing Specific Run Pages")
     print("-" * 30)
 
-    try:
-        # Get a run slug to test
-        response = requests.get(f"{base_url}/api/integrated-runs", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            if data['runs']:
-                slug = data['runs'][0]['slug']
-
-                # Test run page
-                response = requests.get(f"{base_url}/integrated-runs/{slug}", timeout=5)
-                print(f"GET /integrated-runs/{slug}: {response.status_code}")
-
-                # Test status API
-                response = requests.get(f"{base_url}/api/integrated-runs/{slug}/status", timeout=5)
-                print(f"GET /api/integrated-runs/{slug}/status: {response.status_code}")
-                if response.status_code == 200:
-                    status = response.json()
-                    print(f"  Status: {status['status']}, Progress: {status['progress']}")
-            else:
-                print("No runs found to test")
+    # Reuse the run list fetched above to pick a slug
+    if runs:
+        slug = runs[0]['slug']
 
-    except Exception as e:
-        print(f"❌ Run page test error: {e}")
+        # Test run page
+        response = http_client.get(f"{base_url}/integrated-runs/{slug}")
+        print(f"GET /integrated-runs/{slug}: {response.status_code}")
+        if response.status_code != 200:
+            failures.append(f"/integrated-runs/{slug}: {response.status_code}")
+
+        # Test status API
+        response = http_client.get(f"{base_url}/api/integrated-runs/{slug}/status")
+        print(f"GET /api/integrated-runs/{slug}/status: {response.status_code}")
+        if response.status_code == 200:
+            status = response.json()
+            print(f"  Status: {status['status']}, Progress: {status['progress']}")
+        else:
+            failures.append(f"/api/integrated-runs/{slug}/status: {response.status_code}")
+    else:
+        print("No runs found to test")
 
+    assert not failures, f"Endpoints failed: {failures}"
     print("\n✅ Endpoint testing complete")
-    return True
 
-def test_server_info():
-    """Get server information"""
+def show_server_info(client):
+    """Print which local ports have a server running"""
     print("\n🔍 Server Information")
     print("-" * 30)
 
-    # Check what's running on different ports
+    # Check what's running on different ports. A raw connect filters out dead
+    # ports first, then the live ones get their /health probes concurrently.
     ports = [8000, 8005, 8080, 8001]
+    alive = [port for port in ports if _port_open("localhost", port)]
+    responses = asyncio.run(_check_ports(alive)) if alive else {}
+
     for port in ports:
-        try:
-            response = requests.get(f"http://localhost:{port}/health", timeout=2)
-            if response.status_code == 200:
-                print(f"✅ Server running on port {port}")
-                try:
-                    # Try to get API info
-                    api_response = requests.get(f"http://localhost:{port}/api/integrated-runs", timeout=2)
-                    if api_response.status_code == 200:
-                        data = api_response.json()
-                        print(f"   📊 {len(data['runs'])} integrated runs found")
-                    else:
-                        print(f"   ⚠️  Integrated runs API not available: {api_response.status_code}")
-                except:
-                    print(f"   ⚠️  No integrated runs API")
-            else:
-                print(f"❌ Port {port}: {response.status_code}")
-        except requests.exceptions.ConnectionError:
+        response = responses.get(port)
+        if response is None or isinstance(response, httpx.ConnectError):
             print(f"🔇 Port {port}: No server")
-        except Exception as e:
-            print(f"❓ Port {port}: {e}")
+        elif isinstance(response, Exception):
+            print(f"❓ Port {port}: {response}")
+        elif response.status_code == 200:
+            print(f"✅ Server running on port {port}")
+            try:
+                # Try to get API info
+                api_response = client.get(f"http://localhost:{port}/api/integrated-runs", timeout=PORT_TIMEOUT)
+                if api_response.status_code == 200:
+                    data = api_response.json()
+                    print(f"   📊 {len(data['runs'])} integrated runs found")
+                else:
+                    print(f"   ⚠️  Integrated runs API not available: {api_response.status_code}")
+            except:
+                print(f"   ⚠️  No integrated runs API")
+        else:
+            print(f"❌ Port {port}: {response.status_code}")
 
 if __name__ == "__main__":
-    test_server_info()
-    test_endpoints()
\ No newline at end of file
+    with httpx.Client(timeout=TIMEOUT) as client:
+        show_server_info(client)
+        try:
+            test_endpoints("http://localhost:8000", client)
+        except httpx.ConnectError:
+            print("❌ Server not running on port 8000")
+            print("💡 Start server with: ./venv/bin/python main.py")
\ No newline at end of file
@@ -5,31 +5,47 @@ Test script to verify fixes for CSS and simulation execution
 
 import asyncio
 import json
+import os
+import pytest
 import requests
 import time
+from os.path import exists, isdir
 from pathlib import Path
 
 
 def test_css_file_exists():
     """Test that CSS file exists and is accessible"""
     css_path = Path("web/static/css/main.css")
-    assert css_path.exists(), "CSS file should exist"
+    assert exists(css_path), "CSS file should exist"
+    assert os.stat(css_path).st_size > 1000, "CSS file should have substantial content"
 
-    content = css_path.read_text()
-    assert len(content) > 1000, "CSS file should have substantial content"
-    assert ".btn" in content, "CSS should contain button styles"
-    assert ".form-group" in content, "CSS should contain form styles"
+    # Selectors are ASCII, so match on the raw bytes without decoding
+    with open(css_path, "rb") as f:
+        content = f.read()
+    assert b".btn" in content, "CSS should contain button styles"
+    assert b".form-group" in content, "CSS should contain form styles"
 
     print("✅ CSS file exists and has proper content")
 
 
-def test_simulation_command_mapping():
-    """Test that simulation types map correctly to training.sh modes"""
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
+    """Create the database tables once before any test touches them"""
+    from storage.database import create_tables
+    create_tables()
+    yield
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """One IntegratedRunEngine shared by every test in the session"""
     from integrated_runs import IntegratedRunEngine
+    return IntegratedRunEngine()
 
-    # Test the mapping logic by checking the expected command structure
-    engine = IntegratedRunEngine()
 
+def test_simulation_command_mapping(engine):
+    """Test that simulation types map correctly to training.sh modes"""
+    # Test the mapping logic by checking the expected command structure
     # Test mode mapping
     mode_mapping = {
         'morphic': 'morphic',
@@ -45,9 +61,8 @@ def test_simulation_command_mapping():
 
 def test_results_directory():
     """Test that results directory exists"""
-    results_dir = Path("results")
-    assert results_dir.exists(), "Results directory should exist"
-    assert results_dir.is_dir(), "Results should be a directory"
+    assert exists("results"), "Results directory should exist"
+    assert isdir("results"), "Results should be a directory"
 
     print("✅ Results directory exists")
 
@@ -56,8 +71,7 @@ def test_training_script():
     """Test that training.sh is executable and shows help"""
     import subprocess
 
-    training_script = Path("training.sh")
-    assert training_script.exists(), "training.sh should exist"
+    assert exists("training.sh"), "training.sh should exist"
 
     # Test that it's executable and shows help
     result = subprocess.run(['./training.sh', '--help'],
@@ -70,16 +84,9 @@ def test_training_script():
     print("✅ training.sh is executable and shows proper help")
 
 
-async def test_integrated_run_creation():
+@pytest.mark.asyncio
+async def test_integrated_run_creation(engine):
     """Test creating an integrated run (without execution)"""
-    from integrated_runs import IntegratedRunEngine
-    from storage.database import create_tables
-
-    # Initialize database
-    create_tables()
-
-    engine = IntegratedRunEngine()
-
     # Test parameters
     test_params = {
         "generations": 10,  # Very small for testing
@@ -117,13 +124,20 @@ def main():
     print("=" * 40)
 
     try:
+        from integrated_runs import IntegratedRunEngine
+        from storage.database import create_tables
+
+        # Initialize database
+        create_tables()
+        engine = IntegratedRunEngine()
+
         test_css_file_exists()
-        test_simulation_command_mapping()
+        test_simulation_command_mapping(engine)
         test_results_directory()
         test_training_script()
 
         # Run async test
-        asyncio.run(test_integrated_run_creation())
+        asyncio.run(test_integrated_run_creation(engine))
 
         print("\n🎉 All fix tests passed!")
         print("✅ CSS file created and accessible")
@@ -8,14 +8,29 @@ Basic tests to verify the integrated runs functionality works correctly.
 import pytest
 import json
 import asyncio
+import os
+from functools import lru_cache
+from os.path import exists
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available, fall back to the standard json module
+    orjson = None
+
 # Test imports
 try:
-    from storage.models import generate_unique_slug, generate_run_id
+    from storage.models import generate_unique_slug, generate_run_id, IntegratedRun, SimulationRun
+    import integrated_runs
     from integrated_runs import IntegratedRunEngine
-    from storage.database import get_database_info
+    from storage.database import Base, DatabaseConfig, get_database_info
     import_success = True
 except ImportError as e:
     import_success = False
@@ -77,6 +92,115 @@ def test_database_config():
     assert db_info["type"] in ["SQLite", "PostgreSQL"]
 
 
+def _memory_engine():
+    """A private in-memory SQLite engine shared by every session opened on it"""
+    return create_engine("sqlite://", poolclass=StaticPool,
+                         connect_args={"check_same_thread": False})
+
+
+def test_add_missing_columns_and_indexes():
+    """Test that columns and indexes added to a model reach an older table"""
+    if not import_success:
+        pytest.skip("Imports failed")
+
+    engine = _memory_engine()
+    with engine.begin() as conn:
+        # simulation_runs as it was before the summary columns and indexes
+        conn.execute(text(
+            "CREATE TABLE simulation_runs ("
+            "id INTEGER PRIMARY KEY, run_id VARCHAR(50) NOT NULL, "
+            "simulation_type VARCHAR(20) NOT NULL, parameters JSON NOT NULL, "
+            "status VARCHAR(20) NOT NULL)"
+        ))
+        # Only the existing table is touched; the migration creates no tables
+        DatabaseConfig._add_missing_columns(conn)
+        DatabaseConfig._add_missing_indexes(conn)
+        assert inspect(conn).get_table_names() == ["simulation_runs"]
+
+    table = SimulationRun.__table__
+    inspector = inspect(engine)
+    columns = {col["name"] for col in inspector.get_columns("simulation_runs")}
+    assert columns == {col.name for col in table.columns}
+    indexes = {index["name"] for index in inspector.get_indexes("simulation_runs")}
+    assert {index.name for index in table.indexes} <= indexes
+
+    # A second pass finds nothing left to add
+    with engine.begin() as conn:
+        DatabaseConfig._add_missing_columns(conn)
+        DatabaseConfig._add_missing_indexes(conn)
+
+
+def test_apply_results_summary():
+    """Test copying a results file summary onto a simulation run"""
+    if not import_success:
+        pytest.skip("Imports failed")
+
+    # Full results file with a population history and influence list
+    run = SimulationRun()
+    run.apply_results_summary({
+        "generations": 4,
+        "final_population": 7,
+        "grid_size": 10,
+        "population_history": [5, 6, 8, 7],
+        "morphic_influences": [{"generation": 1}] * 8,
+    })
+    assert run.generations == 4
+    assert run.final_population == 7
+    assert run.population_history == [5, 6, 8, 7]
+    assert all(type(p) is int for p in run.population_history)
+    assert run.morphic_influence_rate == pytest.approx(8 / (4 * 10 * 10) * 100)
+
+    # Streamed summary: per-generation records and an influence count
+    run = SimulationRun()
+    run.apply_results_summary({
+        "generations": 2,
+        "grid_size": 5,
+        "generation_data": [{"population": 3}, {}],
+        "morphic_influence_count": 5,
+    })
+    assert run.population_history == [3, 0]
+    assert run.morphic_influence_rate == pytest.approx(5 / (2 * 5 * 5) * 100)
+
+    # No grid size means no influence rate
+    run = SimulationRun()
+    run.apply_results_summary({"generations": 2, "morphic_influence_count": 5})
+    assert run.morphic_influence_rate is None
+
+
+@pytest.mark.asyncio
+async def test_create_integrated_run_slug_retry(tmp_path, monkeypatch):
+    """Test that a slug taken by another process is retried, up to SLUG_ATTEMPTS"""
+    if not import_success:
+        pytest.skip("Imports failed")
+
+    engine = _memory_engine()
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.add(IntegratedRun(run_id=generate_run_id(), slug="taken", parameters={}))
+        session.commit()
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(integrated_runs, "get_session", Session)
+    run_engine = IntegratedRunEngine()
+
+    # A clash on the first slug falls through to the next one
+    slugs = iter(["taken", "fresh"])
+    monkeypatch.setattr(integrated_runs, "generate_unique_slug", lambda custom: next(slugs))
+    assert await run_engine.create_integrated_run({}) == "fresh"
+
+    # Every attempt clashing gives up with the IntegrityError
+    attempts = []
+    monkeypatch.setattr(integrated_runs, "generate_unique_slug",
+                        lambda custom: attempts.append(custom) or "taken")
+    with pytest.raises(IntegrityError):
+        await run_engine.create_integrated_run({}, "taken")
+    assert len(attempts) == integrated_runs.SLUG_ATTEMPTS
+
+    with Session() as session:
+        assert session.query(IntegratedRun).count() == 2
+
+
 @pytest.mark.asyncio
 async def test_integrated_run_engine_init():
     """Test that IntegratedRunEngine can be initialized"""
@@ -87,13 +211,18 @@ async def test_integrated_run_engine_init():
     assert engine.results_dir.exists()  # Should create results directory
 
 
+@lru_cache(maxsize=None)
+def _load_factoids():
+    """Parse conway_factoids.json once per test run"""
+    raw = Path("conway_factoids.json").read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def test_conway_factoids_exist():
     """Test that Conway factoids file exists and is valid JSON"""
-    factoids_path = Path("conway_factoids.json")
-    assert factoids_path.exists(), "Conway factoids file should exist"
+    assert exists("conway_factoids.json"), "Conway factoids file should exist"
 
-    with open(factoids_path, 'r') as f:
-        data = json.load(f)
+    data = _load_factoids()
 
     assert "factoids" in data
     assert len(data["factoids"]) > 0
@@ -116,9 +245,14 @@ def test_file_structure():
         "conway_factoids.json"
     ]
 
+    # List each directory once rather than stat-ing every file
+    listings = {}
     for file_path in required_files:
-        path = Path(file_path)
-        assert path.exists(), f"Required file {file_path} should exist"
+        directory, _, name = file_path.rpartition("/")
+        directory = directory or "."
+        if directory not in listings:
+            listings[directory] = set(os.listdir(directory))
+        assert name in listings[directory], f"Required file {file_path} should exist"
 
 
 @pytest.mark.asyncio
@@ -7,15 +7,24 @@ Verify that the interface updates are working correctly.
 
 import requests
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=1)
+def _main_py_text():
+    """Read main.py once and share it across all the checks below"""
+    return Path("main.py").read_text()
+
+def _missing(patterns):
+    """Return the patterns that do not appear in main.py"""
+    content = _main_py_text()
+    return [pattern for pattern in patterns if pattern not in content]
+
 def test_interface_content():
     """Test that the main interface contains the expected content"""
     # Read the main.py file to verify content
-    main_py = Path("main.py")
-    assert main_py.exists(), "main.py should exist"
-
-    content = main_py.read_text()
+    assert Path("main.py").exists(), "main.py should exist"
 
     # Check for new interface elements
     interface_elements = [
@@ -33,16 +42,13 @@ def test_interface_content():
         "LLM Integration Active"
     ]
 
-    for element in interface_elements:
-        assert element in content, f"Interface should contain '{element}'"
+    missing = _missing(interface_elements)
+    assert not missing, f"Interface should contain {missing}"
 
     print("✅ Interface content verification passed")
 
 def test_css_classes():
     """Test that new CSS classes are present"""
-    main_py = Path("main.py")
-    content = main_py.read_text()
-
     css_classes = [
         ".hero-features",
         ".hero-badge",
@@ -56,16 +62,13 @@ def test_css_classes():
         ".badge.new"
     ]
 
-    for css_class in css_classes:
-        assert css_class in content, f"CSS should contain '{css_class}'"
+    missing = _missing(css_classes)
+    assert not missing, f"CSS should contain {missing}"
 
     print("✅ CSS classes verification passed")
 
 def test_responsive_design():
     """Test that responsive design elements are present"""
-    main_py = Path("main.py")
-    content = main_py.read_text()
-
     responsive_elements = [
         "@media (max-width: 768px)",
         "@media (max-width: 480px)",
@@ -73,16 +76,13 @@ def test_responsive_design():
         "grid-template-columns: 1fr"
     ]
 
-    for element in responsive_elements:
-        assert element in content, f"Responsive design should contain '{element}'"
+    missing = _missing(responsive_elements)
+    assert not missing, f"Responsive design should contain {missing}"
 
     print("✅ Responsive design verification passed")
 
 def test_navigation_structure():
     """Test that navigation structure is properly organized"""
-    main_py = Path("main.py")
-    content = main_py.read_text()
-
     # Check for proper section organization
     sections = [
         "🚀 Integrated Research Platform",
@@ -92,16 +92,16 @@ def test_navigation_structure():
         "🔬 Core Technologies"
     ]
 
-    for section in sections:
-        assert section in content, f"Navigation should contain section '{section}'"
+    missing = _missing(sections)
+    assert not missing, f"Navigation should contain section {missing}"
 
     print("✅ Navigation structure verification passed")
 
+# Matches every documented integrated-runs route in one pass over main.py
+_API_ENDPOINT_RX = re.compile(r"\b(POST|GET|DELETE)\s+(/api/integrated-runs(?:/\{slug\}(?:/status)?)?)")
+
 def test_api_endpoints():
     """Test that API endpoints are documented"""
-    main_py = Path("main.py")
-    content = main_py.read_text()
-
     api_endpoints = [
         "POST /api/integrated-runs",
         "GET /api/integrated-runs/{slug}/status",
@@ -109,24 +109,22 @@ def test_api_endpoints():
         "DELETE /api/integrated-runs/{slug}"
     ]
 
-    for endpoint in api_endpoints:
-        assert endpoint in content, f"API documentation should contain '{endpoint}'"
+    documented = {f"{method} {path}" for method, path in _API_ENDPOINT_RX.findall(_main_py_text())}
+    missing = [endpoint for endpoint in api_endpoints if endpoint not in documented]
+    assert not missing, f"API documentation should contain {missing}"
 
     print("✅ API endpoints documentation passed")
 
 def test_integrated_runs_links():
     """Test that integrated runs links are present"""
-    main_py = Path("main.py")
-    content = main_py.read_text()
-
     links = [
         "/integrated-runs/create",
         "/integrated-runs/gallery",
         "/integrated-runs/{slug}"
     ]
 
-    for link in links:
-        assert link in content, f"Should contain link '{link}'"
+    missing = _missing(links)
+    assert not missing, f"Should contain link {missing}"
 
     print("✅ Integrated runs links verification passed")
 
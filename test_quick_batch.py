@@ -2,27 +2,33 @@
 """Quick test of batch runner with short simulations"""
 
 import sys
-import subprocess
-
-# Run batch with very short simulations for quick testing
-cmd = [
-    './venv/bin/python', 'batch_runner.py',
-    '--experiment-type=focused',
-    '--limit=2'
-]
-
-print("🧪 Testing batch runner with real-time output...")
-print("=" * 60)
-print("NOTE: This should show experiment details and generation progress in real-time")
-print("=" * 60)
-print()
-
-# Run without capturing output so we see it in real-time
-result = subprocess.run(cmd, timeout=180)
-
-print()
-print("=" * 60)
-print(f"Exit code: {result.returncode}")
-print("=" * 60)
-
-sys.exit(result.returncode)
+
+import batch_runner
+
+
+def run_quick_batch():
+    """Run a two-experiment focused batch in-process"""
+    print("🧪 Testing batch runner with real-time output...")
+    print("=" * 60)
+    print("NOTE: This should show experiment details and generation progress in real-time")
+    print("=" * 60)
+    print()
+
+    # Call the runner directly instead of shelling out to a fresh interpreter,
+    # and stop at the first failed experiment rather than running the rest
+    try:
+        batch_runner.main(['--experiment-type=focused', '--limit=2', '--fail-fast'])
+        returncode = 0
+    except SystemExit as e:
+        returncode = e.code or 0
+
+    print()
+    print("=" * 60)
+    print(f"Exit code: {returncode}")
+    print("=" * 60)
+
+    return returncode
+
+
+if __name__ == "__main__":
+    sys.exit(run_quick_batch())
@@ -3,37 +3,130 @@
 Test the server functionality including CSS serving and analysis endpoints
 """
 
+import atexit
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from pathlib import Path
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import signal
+import socket
 import os
+import sys
 import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# All probes hit the same local server, so one small keep-alive pool serves them
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_get = SESSION.get
+
+# Static assets are revalidated with their last ETag; a 304 counts as success
+CONDITIONAL_ENDPOINTS = {"/static/css/main.css"}
+ETAG_CACHE = Path(".cache/etags.json")
+
+def _load_etags():
+    """Read ETags remembered from earlier runs"""
+    try:
+        return json.loads(ETAG_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _save_etags(etags):
+    """Remember ETags for the next run"""
+    ETAG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    ETAG_CACHE.write_text(json.dumps(etags, indent=2))
 
 def start_server():
     """Start the server in background"""
-    return subprocess.Popen(
-        ['./venv/bin/python', 'main.py'],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        preexec_fn=os.setsid
+    venv_python = Path("venv/bin/python")
+    python_cmd = f"./{venv_python}" if venv_python.exists() else sys.executable
+
+    # Nothing reads the server's output, so discard it rather than letting a
+    # full pipe block the server mid-request. /selftest is opt-in on main.py.
+    process = subprocess.Popen(
+        [python_cmd, 'main.py'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        env={**os.environ, "ENABLE_SELFTEST": "1"}
     )
+    # Reap the server even if we're interrupted before the normal shutdown
+    atexit.register(stop_server, process)
+    return process
+
+def _port_open(port, timeout=0.1):
+    """Check whether the server accepts TCP connections yet"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
 
-def wait_for_server(port=8000, timeout=10):
-    """Wait for server to be ready"""
-    for _ in range(timeout):
+def wait_for_server(port=8000, timeout=10, process=None):
+    """Wait for server to be ready, polling with exponential backoff
+
+    If the server's process is given, stop waiting as soon as it exits.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.025
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
         try:
-            response = requests.get(f"http://localhost:{port}/health", timeout=2)
-            if response.status_code == 200:
-                return True
-        except:
-            time.sleep(1)
+            # Only build an HTTP request once the port is actually listening
+            if _port_open(port):
+                response = _get(f"http://localhost:{port}/health", timeout=0.5)
+                if response.status_code == 200:
+                    return True
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            pass
+        # Start polling fast so a quick startup is noticed quickly, then back off
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
     return False
 
-def test_endpoints():
-    """Test key endpoints"""
-    base_url = "http://localhost:8000"
+def _selftest(base_url, tests):
+    """Get every endpoint's status from the server's /selftest in one request
+
+    Returns None when the server has no /selftest or it doesn't cover all of
+    the tests, so the caller can probe the endpoints individually.
+    """
+    try:
+        response = _get(f"{base_url}/selftest", timeout=5)
+    except requests.exceptions.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+
+    statuses = response.json()
+    if not all(endpoint in statuses for endpoint, _ in tests):
+        return None
+
+    results = {}
+    for endpoint, description in tests:
+        status = statuses[endpoint]
+        results[description] = {
+            'status': status,
+            'success': status == 200
+        }
+        print(f"{'✅' if status == 200 else '❌'} {description}: {status}")
+    return results
+
+def stop_server(server_process, grace=2.0):
+    """Shut down the server's process group, escalating to SIGKILL if it lingers"""
+    if server_process.poll() is not None:
+        return
+    pgid = os.getpgid(server_process.pid)
+    os.killpg(pgid, signal.SIGTERM)
+    try:
+        server_process.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        os.killpg(pgid, signal.SIGKILL)
+        server_process.wait(timeout=1)
 
+def probe_endpoints(base_url):
+    """Probe the key endpoints and return a result per endpoint"""
     tests = [
         ("/static/css/main.css", "CSS file"),
         ("/integrated-runs/gallery", "Gallery page"),
@@ -41,26 +134,116 @@ def test_endpoints():
         ("/", "Main page")
     ]
 
+    results = _selftest(base_url, tests)
+    if results is not None:
+        return results
+
     results = {}
+    etags = _load_etags()
+    etags_changed = False
 
-    for endpoint, description in tests:
-        try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            results[description] = {
-                'status': response.status_code,
-                'success': response.status_code == 200
-            }
-            print(f"✅ {description}: {response.status_code}")
-        except Exception as e:
-            results[description] = {
-                'status': 'ERROR',
-                'success': False,
-                'error': str(e)
-            }
-            print(f"❌ {description}: {e}")
+    def headers_for(endpoint):
+        if endpoint in CONDITIONAL_ENDPOINTS and endpoint in etags:
+            return {"If-None-Match": etags[endpoint]}
+        return None
+
+    # The probes are independent, so run them concurrently on the shared pool.
+    # Only the status and headers are checked, so bodies are streamed and
+    # dropped unread; each probe uses its own connection anyway.
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {
+            executor.submit(_get, f"{base_url}{endpoint}", timeout=5, stream=True,
+                            headers=headers_for(endpoint)): (endpoint, description)
+            for endpoint, description in tests
+        }
+
+        for future in as_completed(futures):
+            endpoint, description = futures[future]
+            try:
+                response = future.result()
+                ok_statuses = (200, 304) if endpoint in CONDITIONAL_ENDPOINTS else (200,)
+                results[description] = {
+                    'status': response.status_code,
+                    'success': response.status_code in ok_statuses
+                }
+                etag = response.headers.get("ETag")
+                if endpoint in CONDITIONAL_ENDPOINTS and response.status_code == 200 and etag:
+                    etags[endpoint] = etag
+                    etags_changed = True
+                response.close()
+                print(f"✅ {description}: {response.status_code}")
+            except Exception as e:
+                results[description] = {
+                    'status': 'ERROR',
+                    'success': False,
+                    'error': str(e)
+                }
+                print(f"❌ {description}: {e}")
+
+    if etags_changed:
+        _save_etags(etags)
 
     return results
 
+def test_endpoints(live_server):
+    """Test key endpoints"""
+    results = probe_endpoints(live_server)
+    failed = [description for description, result in results.items() if not result['success']]
+    assert all(r['success'] for r in results.values()), f"Endpoints failed: {failed}"
+
+class _NoSelftestHandler(BaseHTTPRequestHandler):
+    """Serves the probed endpoints like main.py without /selftest, with an ETag on the CSS"""
+    etag = '"main-css-1"'
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/selftest":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/static/css/main.css" and self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+        else:
+            body = b"body { margin: 0; }" if self.path.endswith(".css") else b"ok"
+            self.send_response(200)
+            if self.path.endswith(".css"):
+                self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def test_probe_endpoints_fallback(tmp_path, monkeypatch):
+    """Without /selftest, each endpoint is probed and the CSS is revalidated by ETag"""
+    monkeypatch.setattr(sys.modules[__name__], "ETAG_CACHE", tmp_path / "etags.json")
+    _NoSelftestHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _NoSelftestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        first = probe_endpoints(base_url)
+        second = probe_endpoints(base_url)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert all(result['success'] for result in first.values())
+    assert first["CSS file"]['status'] == 200
+    assert _load_etags() == {"/static/css/main.css": _NoSelftestHandler.etag}
+
+    # The stored ETag turns the second CSS probe into a successful 304
+    assert all(result['success'] for result in second.values())
+    assert second["CSS file"]['status'] == 304
+    css_requests = [etag for path, etag in _NoSelftestHandler.requests_seen
+                    if path == "/static/css/main.css"]
+    assert css_requests == [None, _NoSelftestHandler.etag]
+
 def main():
     print("🧪 Testing Server Functionality")
     print("=" * 40)
@@ -71,12 +254,12 @@ def main():
 
     try:
         # Wait for server to be ready
-        if wait_for_server():
+        if wait_for_server(process=server_process):
             print("✅ Server started successfully")
 
             # Test endpoints
             print("\n📡 Testing endpoints...")
-            results = test_endpoints()
+            results = probe_endpoints("http://localhost:8000")
 
             # Summary
             print(f"\n📊 Results Summary:")
@@ -95,8 +278,7 @@ def main():
     finally:
         # Clean shutdown
         print("\n🛑 Shutting down server...")
-        os.killpg(os.getpgid(server_process.pid), signal.SIGTERM)
-        server_process.wait()
+        stop_server(server_process)
         print("✅ Server shutdown complete")
 
 if __name__ == "__main__":
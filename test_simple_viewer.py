@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the historical viewer's results file loaders
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+try:
+    import simple_viewer
+    from simple_viewer import ijson, load_recent_runs, load_simulation_data, load_simulation_summary
+    from storage.database import Base
+    from storage.models import SimulationRun
+    import_success = True
+except ImportError as e:
+    import_success = False
+    import_error = str(e)
+
+
+SAMPLE_RESULTS = {
+    "generations": 4,
+    "grid_size": 10,
+    "final_population": 6,
+    "generation_data": [
+        {"generation": 0, "population": 12},
+        {"generation": 1},  # population missing from this record
+        {"generation": 2, "population": 9},
+        {"generation": 3, "population": 6},
+    ],
+    "morphic_influences": [{"generation": 1}, {"generation": 3}],
+}
+
+
+def test_summary_matches_full_load(tmp_path):
+    """Test that the streamed summary agrees with the full load"""
+    if not import_success:
+        pytest.skip(f"Imports failed: {import_error}")
+    if ijson is None:
+        pytest.skip("ijson not installed")
+
+    path = tmp_path / "simulation_sample.json"
+    path.write_text(json.dumps(SAMPLE_RESULTS))
+
+    data = load_simulation_data(path)
+    summary = load_simulation_summary(path)
+
+    assert summary["population_history"] == [12, 0, 9, 6]
+    assert summary["population_history"] == list(data["population_history"])
+    for key in ("generations", "grid_size", "final_population"):
+        assert summary[key] == data[key]
+    assert summary["morphic_influence_count"] == len(data["morphic_influences"])
+
+
+def test_loaders_accept_nan(tmp_path):
+    """Test that NaN/Infinity written by json.dump still load"""
+    if not import_success:
+        pytest.skip(f"Imports failed: {import_error}")
+
+    results = dict(SAMPLE_RESULTS, stability_score=float("nan"), complexity_score=float("inf"))
+    path = tmp_path / "simulation_nan.json"
+    path.write_text(json.dumps(results))
+
+    data = load_simulation_data(path)
+    assert data["complexity_score"] == float("inf")
+    assert list(data["population_history"]) == [12, 0, 9, 6]
+
+    summary = load_simulation_summary(path)
+    assert list(summary["population_history"]) == [12, 0, 9, 6]
+
+
+@pytest.mark.asyncio
+async def test_recent_runs_skip_failed_backfill(tmp_path, monkeypatch):
+    """Test that a run whose results file is gone is only read once"""
+    if not import_success:
+        pytest.skip(f"Imports failed: {import_error}")
+
+    engine = create_engine("sqlite://", poolclass=StaticPool,
+                           connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.add(SimulationRun(run_id="missing-file", simulation_type="morphic", parameters={},
+                                  results_path=str(tmp_path / "simulation_missing.json")))
+        session.commit()
+
+    read_paths = []
+    summarize = simple_viewer.load_simulation_summaries
+
+    async def counting_summaries(paths):
+        read_paths.extend(paths)
+        return await summarize(paths)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(simple_viewer, "get_session", Session)
+    monkeypatch.setattr(simple_viewer, "load_simulation_summaries", counting_summaries)
+
+    assert await load_recent_runs() == []
+    assert await load_recent_runs() == []
+    assert read_paths == [str(tmp_path / "simulation_missing.json")]
+
+    with Session() as session:
+        assert session.query(SimulationRun.population_history).scalar() == []